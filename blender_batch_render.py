@@ -21,13 +21,27 @@ See README.md for detailed documentation.
 import bpy
 import math
 import os
+import re
 import sys
 import argparse
+import hashlib
 import json
+import subprocess
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Tuple, Optional, List
+from typing import Callable, Dict, Tuple, Optional, List
 import logging
-from mathutils import Vector
+from mathutils import Matrix, Vector
+
+# NumPy ships with Blender; keep pure-Python fallbacks for builds without it
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    print("WARNING: NumPy not available - using slower pure-Python bounding box and crop")
 
 # Optional PIL import for auto-crop feature
 try:
@@ -56,6 +70,10 @@ class RenderConfig:
         self.camera_angle: float = 55.0  # degrees from horizontal (55 = classic angled view, 90 = pure top-down)
         self.camera_yaw: float = 0.0  # degrees Z-rotation (0 = north-facing, 45 = isometric diamond)
         self.samples: int = 64  # anti-aliasing quality
+        self.draft: bool = False  # Fast preview: 16 samples, no AO/bloom, uncompressed PNG
+        self.engine: str = 'eevee'  # 'eevee' (fast raster) or 'cycles' (GPU path tracing for dense meshes)
+        self.device: str = 'OPTIX'  # Cycles compute device: CPU, CUDA, OPTIX, HIP, METAL, ONEAPI
+        self.persistent_data: bool = True  # Reuse render data between renders (more memory)
 
         # Real-world scaling (FIXED SCALE APPROACH) - Render at 2× for quality
         self.ortho_scale: float = 4.0  # Ortho camera shows 4x4 Blender units (fits all assets)
@@ -75,9 +93,25 @@ class RenderConfig:
         self.formats: List[str] = ['.gltf', '.glb', '.obj', '.fbx']
         self.skip_existing: bool = False
         self.auto_crop: bool = PIL_AVAILABLE  # Trim transparent pixels (requires PIL/Pillow)
+        self.png_compress_level: int = 1  # PNG zlib level (1 = fastest, 9 = smallest)
         self.scale_factor: float = 1.0  # Scale imported models (e.g., 0.5 to halve size)
+        self.orphan_purge_interval: int = 50  # Purge unused meshes/materials/images every N models
+        self.import_cache: bool = True  # Reuse imported models saved as .blend on later runs
+        self.import_cache_dir: str = os.path.join(os.path.expanduser('~'), '.cache', 'blender-sprite-render', 'imports')
+
+        # Parallelism
+        self.jobs: int = 1  # Blender worker processes (0 = one per CPU core)
+        self.worker_shard: Optional[Tuple[int, int]] = None  # (index, count) when running as a shard worker
+        self.shard_dir: Optional[str] = None  # Temp directory with shard model lists and results
+
+        # Derived constants (filled in once by setup_camera, invariant for the whole batch)
+        self.angle_rad: float = 0.0
+        self.local_y_offset: float = 0.0  # Camera offset from the object center in the yaw-0 frame
+        self.local_z_offset: float = 0.0
+        self.canvas_size: int = 0
 
         # Output
+        self.per_file_metadata: bool = False  # JSON sidecar per sprite instead of one _sprites.json per directory
         self.verbose: bool = False
         self.log_file: Optional[str] = None
 
@@ -91,10 +125,13 @@ def setup_logging(config: RenderConfig) -> logging.Logger:
     logger = logging.getLogger('blender_batch_render')
     logger.setLevel(logging.DEBUG if config.verbose else logging.INFO)
 
-    # Console handler
+    # Console handler (workers prefix their shard so interleaved output stays readable)
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.DEBUG if config.verbose else logging.INFO)
-    console_formatter = logging.Formatter('%(levelname)s: %(message)s')
+    prefix = ""
+    if config.worker_shard:
+        prefix = f"[shard {config.worker_shard[0] + 1}/{config.worker_shard[1]}] "
+    console_formatter = logging.Formatter(prefix + '%(levelname)s: %(message)s')
     console_handler.setFormatter(console_formatter)
     logger.addHandler(console_handler)
 
@@ -119,23 +156,23 @@ def setup_logging(config: RenderConfig) -> logging.Logger:
 # ============================================================================
 
 def clear_scene():
-    """Remove all default objects from the scene"""
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete()
-
-    # Clear orphaned data
-    for block in bpy.data.meshes:
-        if block.users == 0:
-            bpy.data.meshes.remove(block)
-    for block in bpy.data.materials:
-        if block.users == 0:
-            bpy.data.materials.remove(block)
-    for block in bpy.data.textures:
-        if block.users == 0:
-            bpy.data.textures.remove(block)
-    for block in bpy.data.images:
-        if block.users == 0:
-            bpy.data.images.remove(block)
+    """
+    Remove all objects and the data they leave orphaned (no operator overhead).
+    The scene's World is kept, so the startup file's ambient lighting still applies.
+    """
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+    bpy.data.orphans_purge(do_recursive=True)
+
+
+def configure_batch_mode():
+    """Turn off interactive-session features that only cost time and memory in a headless batch"""
+    prefs = bpy.context.preferences
+    prefs.use_preferences_save = False  # Never persist these batch-only settings
+    prefs.edit.use_global_undo = False  # No undo snapshots on every data change
+    prefs.view.show_splash = False
+    prefs.filepaths.use_auto_save_temporary_files = False
+    prefs.system.memory_cache_limit = 512  # MB; keeps the image cache from growing across thousands of models
 
 
 def setup_camera(config: RenderConfig) -> bpy.types.Object:
@@ -145,14 +182,16 @@ def setup_camera(config: RenderConfig) -> bpy.types.Object:
     camera = bpy.context.active_object
     camera.name = "OrthographicCamera"
 
-    # Set rotation (position will be set per-object by calculate_canvas_and_position)
-    angle_rad = math.radians(config.camera_angle)
-    yaw_rad = math.radians(config.camera_yaw)
-    camera.rotation_euler = (
-        angle_rad,  # X: pitch angle (90° = top-down, lower = more angled)
-        0.0,        # Y: no roll
-        yaw_rad     # Z: yaw rotation (0° = north-facing, 45° = diamond view)
-    )
+    # Precompute values that only depend on config, so per-model framing does no pitch trig
+    # Ortho camera distance doesn't affect view, just needs to be > 0
+    camera_distance = 10.0
+    config.angle_rad = math.radians(config.camera_angle)
+    config.local_y_offset = -camera_distance * math.cos(config.angle_rad)
+    config.local_z_offset = camera_distance * math.sin(config.angle_rad)
+    config.canvas_size = compute_canvas_size(config)
+
+    # Set rotation (position will be set per-object by place_camera)
+    camera.rotation_euler = camera_rotation(config, config.camera_yaw)
 
     # Set as orthographic with FIXED scale (consistent for all assets)
     camera.data.type = 'ORTHO'
@@ -183,30 +222,46 @@ def setup_lighting(config: RenderConfig) -> bpy.types.Object:
     return light
 
 
-def setup_render_settings(config: RenderConfig):
+def setup_render_settings(config: RenderConfig, logger: logging.Logger):
     """Configure render engine and output settings"""
     scene = bpy.context.scene
+    samples = min(config.samples, 16) if config.draft else config.samples
 
-    # Render engine: Eevee (fast)
-    # Blender 4.0+ uses BLENDER_EEVEE_NEXT, older versions use BLENDER_EEVEE
-    if 'BLENDER_EEVEE_NEXT' in bpy.types.RenderSettings.bl_rna.properties['engine'].enum_items.keys():
-        scene.render.engine = 'BLENDER_EEVEE_NEXT'
+    if config.engine == 'cycles':
+        setup_cycles(scene, config, samples, logger)
     else:
-        scene.render.engine = 'BLENDER_EEVEE'
+        # Render engine: Eevee (fast)
+        # Blender 4.0+ uses BLENDER_EEVEE_NEXT, older versions use BLENDER_EEVEE
+        if 'BLENDER_EEVEE_NEXT' in bpy.types.RenderSettings.bl_rna.properties['engine'].enum_items.keys():
+            scene.render.engine = 'BLENDER_EEVEE_NEXT'
+        else:
+            scene.render.engine = 'BLENDER_EEVEE'
+
+        # Sampling (anti-aliasing)
+        scene.eevee.taa_render_samples = samples
+
+        # Draft: skip screen-space effects that only matter for final quality
+        if config.draft:
+            for option in ('use_gtao', 'use_bloom'):  # use_bloom no longer exists on EEVEE Next
+                if hasattr(scene.eevee, option):
+                    setattr(scene.eevee, option, False)
 
-    # Sampling (anti-aliasing)
-    scene.eevee.taa_render_samples = config.samples
+    # Keep evaluated scene data, BVH and compiled shaders alive between renders
+    # (models are swapped by object removal, so this carries across the whole batch)
+    scene.render.use_persistent_data = config.persistent_data
 
-    # Output settings
-    scene.render.resolution_x = config.resolution
-    scene.render.resolution_y = config.resolution
+    # Output settings: fixed ortho_scale means one canvas size for every sprite
+    scene.render.resolution_x = config.canvas_size
+    scene.render.resolution_y = config.canvas_size
     scene.render.resolution_percentage = 100
 
     # File format: PNG with alpha
     scene.render.image_settings.file_format = 'PNG'
     scene.render.image_settings.color_mode = 'RGBA'
     scene.render.image_settings.color_depth = '8'
-    scene.render.image_settings.compression = 15
+    # Blender's PNG compression is 0-100% and is turned back into a zlib level with
+    # int(percent / 11.1111), so round up for the level to survive; none for drafts
+    scene.render.image_settings.compression = 0 if config.draft else min(100, math.ceil(config.png_compress_level * 100 / 9))
 
     # Transparency
     scene.render.film_transparent = True
@@ -214,34 +269,180 @@ def setup_render_settings(config: RenderConfig):
     # Color management (keep colors accurate)
     scene.view_settings.view_transform = 'Standard'
 
+    # Auto-crop reads pixels from the compositor instead of re-reading the written PNG
+    if config.auto_crop and PIL_AVAILABLE and NUMPY_AVAILABLE:
+        setup_viewer_output(scene)
+
+
+def setup_cycles(scene: bpy.types.Scene, config: RenderConfig, samples: int, logger: logging.Logger):
+    """Configure Cycles, rendering on the GPU unless device is CPU (for dense meshes)"""
+    scene.render.engine = 'CYCLES'
+    scene.cycles.device = 'CPU'
+
+    if config.device != 'CPU':
+        prefs = bpy.context.preferences.addons['cycles'].preferences
+        try:
+            prefs.compute_device_type = config.device
+        except TypeError:
+            logger.warning(f"Cycles device {config.device} not supported by this Blender build, using CPU")
+        else:
+            prefs.get_devices()
+            for device in prefs.devices:
+                device.use = True
+            scene.cycles.device = 'GPU'
+
+    scene.cycles.samples = samples
+    scene.cycles.use_denoising = True
+    scene.cycles.denoiser = 'OPTIX' if scene.cycles.device == 'GPU' and config.device == 'OPTIX' else 'OPENIMAGEDENOISE'
+
+
+def setup_viewer_output(scene: bpy.types.Scene):
+    """Route the render through a compositor Viewer node so its pixels can be read in memory"""
+    scene.use_nodes = True
+    scene.render.use_compositing = True
+    tree = scene.node_tree
+    tree.nodes.clear()
+
+    layers = tree.nodes.new('CompositorNodeRLayers')
+    composite = tree.nodes.new('CompositorNodeComposite')
+    viewer = tree.nodes.new('CompositorNodeViewer')
+    if hasattr(viewer, 'use_alpha'):  # Removed in Blender 4.2 (alpha always kept)
+        viewer.use_alpha = True
+
+    tree.links.new(layers.outputs['Image'], composite.inputs['Image'])
+    tree.links.new(layers.outputs['Image'], viewer.inputs['Image'])
+
 
 # ============================================================================
 # Object Import & Framing
 # ============================================================================
 
-def import_model(filepath: str, scale_factor: float, logger: logging.Logger) -> bool:
-    """Import a 3D model into the scene and apply scaling"""
+def import_cache_key(filepath: str) -> str:
+    """
+    Content hash identifying a cached import.
+    Salted with the Blender version, and for .gltf also with the size/mtime of
+    referenced external buffers and images so edits to those invalidate the cache.
+    """
+    digest = hashlib.sha1(bpy.app.version_string.encode())
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+
+    if filepath.lower().endswith('.gltf'):
+        with open(filepath, 'r', encoding='utf-8') as f:
+            gltf = json.load(f)
+        base_dir = os.path.dirname(filepath)
+        for entry in gltf.get('buffers', []) + gltf.get('images', []):
+            uri = entry.get('uri', '')
+            if uri and not uri.startswith('data:'):
+                dep_path = os.path.join(base_dir, uri)
+                if os.path.exists(dep_path):
+                    st = os.stat(dep_path)
+                    digest.update(f"{uri}:{st.st_size}:{st.st_mtime_ns}".encode())
+
+    return digest.hexdigest()
+
+
+def prefetch_file(filepath: str):
+    """
+    Hint the OS to read a model file sequentially and start reading it ahead, so the
+    importer parses from a warm page cache. Best effort; no-op without posix_fadvise.
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+
+    try:
+        fd = os.open(filepath, os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+            # Advice values are not flags, so they need separate calls
+            os.posix_fadvise(fd, 0, size, os.POSIX_FADV_SEQUENTIAL)
+            os.posix_fadvise(fd, 0, size, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
+def save_import_cache(cache_path: str, objects: list):
+    """Write freshly imported objects (and everything they reference) to a .blend cache file"""
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+
+    # Write to a temp file first so parallel workers never read a partial cache
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    bpy.data.libraries.write(tmp_path, set(objects), path_remap='ABSOLUTE')
+    os.replace(tmp_path, cache_path)
+
+
+def load_import_cache(cache_path: str):
+    """Append cached objects into the scene and select them, mirroring what the importers do"""
+    with bpy.data.libraries.load(cache_path, link=False) as (data_from, data_to):
+        data_to.objects = data_from.objects
+
+    for obj in bpy.context.selected_objects:
+        obj.select_set(False)
+
+    collection = bpy.context.scene.collection
+    for obj in data_to.objects:
+        collection.objects.link(obj)
+        obj.select_set(True)
+
+
+def import_model(filepath: str, scale_factor: float, logger: logging.Logger,
+                 cache_dir: Optional[str] = None) -> bool:
+    """
+    Import a 3D model into the scene and apply scaling.
+    With cache_dir set, the raw import is saved as .blend and appended on later runs
+    instead of re-running the (much slower) GLTF/OBJ/FBX importer.
+    """
     ext = Path(filepath).suffix.lower()
 
+    if ext not in ('.gltf', '.glb', '.obj', '.fbx'):
+        logger.warning(f"Unsupported format: {ext}")
+        return False
+
     try:
-        if ext == '.gltf' or ext == '.glb':
-            bpy.ops.import_scene.gltf(filepath=filepath)
-        elif ext == '.obj':
-            bpy.ops.import_scene.obj(filepath=filepath)
-        elif ext == '.fbx':
-            bpy.ops.import_scene.fbx(filepath=filepath)
+        cache_path = None
+        if cache_dir:
+            cache_path = os.path.join(cache_dir, f"{import_cache_key(filepath)}.blend")
+
+        if cache_path and os.path.exists(cache_path):
+            load_import_cache(cache_path)
+            logger.debug(f"Loaded from import cache: {cache_path}")
         else:
-            logger.warning(f"Unsupported format: {ext}")
-            return False
+            prefetch_file(filepath)
+
+            if ext == '.gltf' or ext == '.glb':
+                bpy.ops.import_scene.gltf(filepath=filepath)
+            elif ext == '.obj':
+                bpy.ops.import_scene.obj(filepath=filepath)
+            elif ext == '.fbx':
+                bpy.ops.import_scene.fbx(filepath=filepath)
+
+            # Cache the unscaled import so it stays valid for any --scale-factor
+            if cache_path:
+                try:
+                    save_import_cache(cache_path, bpy.context.selected_objects)
+                    logger.debug(f"Saved import cache: {cache_path}")
+                except Exception as e:
+                    logger.warning(f"Failed to write import cache {cache_path}: {e}")
 
         # Apply scale factor to root objects only (children inherit the transform)
         if scale_factor != 1.0:
+            scale_matrix = Matrix.Diagonal((scale_factor, scale_factor, scale_factor, 1.0))
             for obj in bpy.context.selected_objects:
                 if obj.parent is None:  # Only scale root objects to avoid double-scaling
                     obj.scale = (scale_factor, scale_factor, scale_factor)
-                    # Apply scale to make it permanent
-                    bpy.context.view_layer.objects.active = obj
-                    bpy.ops.object.transform_apply(scale=True)
+
+                    # Bake the scale into mesh data directly (what transform_apply does,
+                    # without operator/undo overhead); shared meshes keep object-level scale.
+                    # Shape keys (morph targets/blend shapes) are scaled too, as they drive the shape
+                    if obj.type == 'MESH' and obj.data.users == 1:
+                        obj.data.transform(scale_matrix, shape_keys=True)
+                        obj.scale = (1.0, 1.0, 1.0)
+                        # Keep children where they were now that the parent is unscaled
+                        for child in obj.children:
+                            child.matrix_parent_inverse = scale_matrix @ child.matrix_parent_inverse
             logger.debug(f"Applied scale factor: {scale_factor}")
 
         return True
@@ -251,96 +452,97 @@ def import_model(filepath: str, scale_factor: float, logger: logging.Logger) ->
         return False
 
 
-def calculate_canvas_and_position(camera: bpy.types.Object, config: RenderConfig, logger: logging.Logger) -> Tuple[int, dict]:
+def scene_meshes() -> list:
+    """All mesh objects in the scene"""
+    return [obj for obj in bpy.context.scene.objects if obj.type == 'MESH']
+
+
+def compute_bbox(meshes: list) -> Optional[Tuple[Vector, Vector]]:
     """
-    Calculate canvas size and position camera at object center using FIXED ortho_scale.
-    Center-center alignment: object center = canvas center.
-    Returns canvas size and metadata dict.
+    World-space bounding box of the given mesh objects.
+    Returns (center, dimensions), or None if there are no meshes.
     """
-    # Get bounding box for all mesh objects
-    min_x = min_y = min_z = float('inf')
-    max_x = max_y = max_z = float('-inf')
-
-    mesh_count = 0
-    for obj in bpy.context.scene.objects:
-        if obj.type == 'MESH':
-            mesh_count += 1
-            for corner in obj.bound_box:
-                # Convert to world space
-                world_coord = obj.matrix_world @ Vector(corner)
-                min_x = min(min_x, world_coord.x)
-                max_x = max(max_x, world_coord.x)
-                min_y = min(min_y, world_coord.y)
-                max_y = max(max_y, world_coord.y)
-                min_z = min(min_z, world_coord.z)
-                max_z = max(max_z, world_coord.z)
-
-    if mesh_count == 0:
-        logger.warning("No mesh objects found to frame")
-        return config.min_canvas_size, {}
+    if not meshes:
+        return None
+
+    if not NUMPY_AVAILABLE:
+        return compute_bbox_python(meshes)
+
+    # Transform all bound_box corners to world space in one batch:
+    # (N, 8, 4) homogeneous corners × (N, 4, 4) world matrices
+    corners = np.empty((len(meshes), 8, 4))
+    corners[..., 3] = 1.0
+    for i, obj in enumerate(meshes):
+        corners[i, :, :3] = [tuple(corner) for corner in obj.bound_box]
+    matrices = np.stack([np.array(obj.matrix_world) for obj in meshes])
+    world = np.einsum('nij,nkj->nki', matrices, corners)[..., :3].reshape(-1, 3)
+
+    bbox_min = world.min(axis=0)
+    bbox_max = world.max(axis=0)
+    return Vector(((bbox_min + bbox_max) / 2).tolist()), Vector((bbox_max - bbox_min).tolist())
+
+
+def compute_bbox_python(meshes: list) -> Tuple[Vector, Vector]:
+    """Pure-Python compute_bbox for Blender builds without NumPy"""
+    world = []
+    for obj in meshes:
+        # Evaluate the matrix_world property once per mesh, not once per corner
+        matrix = obj.matrix_world.copy()
+        world.extend(matrix @ Vector(corner) for corner in obj.bound_box)
+
+    xs, ys, zs = zip(*world)
+    bbox_min = Vector((min(xs), min(ys), min(zs)))
+    bbox_max = Vector((max(xs), max(ys), max(zs)))
+    return (bbox_min + bbox_max) / 2, bbox_max - bbox_min
+
+
+def compute_canvas_size(config: RenderConfig) -> int:
+    """Canvas size for the FIXED ortho_scale (power of 2, clamped to the configured range)"""
+    # ortho_scale already has padding built in (8.0 means 8x8 unit view with margin)
+    required_pixels = int(config.ortho_scale * config.pixels_per_unit)
+    canvas_size = 1 << (required_pixels - 1).bit_length()  # Next power of 2, integer-only
+    return max(config.min_canvas_size, min(canvas_size, config.max_canvas_size))
 
-    # Calculate object center (bounding box center)
-    center_x = (min_x + max_x) / 2
-    center_y = (min_y + max_y) / 2
-    center_z = (min_z + max_z) / 2
-
-    # Calculate object dimensions
-    width = max_x - min_x
-    height = max_y - min_y
-    depth = max_z - min_z
-
-    # Position camera at object center with angle offset
-    # Formula verified through manual Blender testing
-    angle_rad = math.radians(config.camera_angle)
-    yaw_rad = math.radians(config.camera_yaw)
-
-    # Calculate camera offset distance (far enough to see everything)
-    camera_distance = 10.0  # Ortho camera distance doesn't affect view, just needs to be > 0
-
-    # Calculate offsets based on angle (from horizontal) and yaw (around Z axis)
-    # First calculate offset in local coordinates (camera facing -Y)
-    local_y_offset = -camera_distance * math.cos(angle_rad)
-    local_z_offset = camera_distance * math.sin(angle_rad)
-
-    # Rotate offset around Z axis by yaw to get world coordinates
-    # Yaw 0° = camera faces -Y (south), 90° = faces -X (east), etc.
-    world_x_offset = local_y_offset * math.sin(yaw_rad)
-    world_y_offset = local_y_offset * math.cos(yaw_rad)
-
-    # Position camera offset from center
-    camera_pos = Vector((
-        center_x + world_x_offset,   # Move based on yaw rotation
-        center_y + world_y_offset,   # Move based on yaw rotation
-        center_z + local_z_offset    # Move up based on angle
-    ))
-    camera.location = camera_pos
-
-    # Point camera at object center using look-at math
-    # Calculate direction vector from camera to center
-    object_center = Vector((center_x, center_y, center_z))
-    direction = object_center - camera_pos
-    direction.normalize()
-
-    # Calculate rotation to point camera at target
-    # Based on Blender camera coordinate system: camera -Z axis points forward
-    rot_quat = direction.to_track_quat('-Z', 'Y')
-    camera.rotation_euler = rot_quat.to_euler()
+
+def camera_rotation(config: RenderConfig, yaw_deg: float) -> Tuple[float, float, float]:
+    """
+    Closed-form camera Euler rotation for the configured pitch and the given yaw.
+    The camera looks down its -Z axis, so tilting (90° - angle) about X aims it
+    down at the object; yawing by -yaw keeps it facing the center as it orbits.
+    """
+    return (
+        math.pi / 2 - config.angle_rad,  # X: 0 = top-down, larger = more angled
+        0.0,                             # Y: no roll
+        -math.radians(yaw_deg)           # Z: yaw (0° = camera south of object, facing north)
+    )
+
+
+def place_camera(camera: bpy.types.Object, center: Vector, yaw_deg: float, config: RenderConfig, logger: logging.Logger):
+    """Orbit the camera around the object center at the configured pitch and the given yaw"""
+    # Rotate the precomputed offset around Z by yaw to get world coordinates
+    # Yaw 0° = camera south of the object (-Y), 90° = camera west of it (-X), etc.
+    yaw_rad = math.radians(yaw_deg)
+    camera.location = (
+        center.x + config.local_y_offset * math.sin(yaw_rad),
+        center.y + config.local_y_offset * math.cos(yaw_rad),
+        center.z + config.local_z_offset
+    )
+    camera.rotation_euler = camera_rotation(config, yaw_deg)
 
     logger.debug(f"Camera positioned at: ({camera.location.x:.2f}, {camera.location.y:.2f}, {camera.location.z:.2f})")
     logger.debug(f"Camera rotation_euler: ({math.degrees(camera.rotation_euler.x):.1f}°, {math.degrees(camera.rotation_euler.y):.1f}°, {math.degrees(camera.rotation_euler.z):.1f}°)")
 
-    # Calculate required canvas size based on FIXED ortho_scale
-    # ortho_scale already has padding built in (8.0 means 8x8 unit view with margin)
-    required_pixels = int(config.ortho_scale * config.pixels_per_unit)
-    canvas_size = 2 ** math.ceil(math.log2(required_pixels))
-    canvas_size = max(config.min_canvas_size, min(canvas_size, config.max_canvas_size))
 
-    # Update scene resolution
-    bpy.context.scene.render.resolution_x = canvas_size
-    bpy.context.scene.render.resolution_y = canvas_size
+def build_metadata(canvas_size: int, center: Vector, dimensions: Vector, config: RenderConfig, logger: logging.Logger) -> dict:
+    """Sprite metadata for the framed object (no ground plane or texture_origin offsets)"""
+    width, height, depth = dimensions
 
-    # Simplified metadata (no ground plane or texture_origin offsets)
-    metadata = {
+    logger.debug(f"Object dimensions: {width:.2f} x {height:.2f} x {depth:.2f} Blender units")
+    logger.debug(f"Object center: ({center.x:.2f}, {center.y:.2f}, {center.z:.2f})")
+    logger.debug(f"Fixed ortho_scale: {config.ortho_scale:.2f}")
+    logger.debug(f"Canvas size: {canvas_size}x{canvas_size}")
+
+    return {
         "canvas_width": canvas_size,
         "canvas_height": canvas_size,
         "ortho_scale": config.ortho_scale,
@@ -349,25 +551,50 @@ def calculate_canvas_and_position(camera: bpy.types.Object, config: RenderConfig
             "width": width,
             "height": height,
             "depth": depth,
-            "center": {"x": center_x, "y": center_y, "z": center_z}
+            "center": {"x": center.x, "y": center.y, "z": center.z}
         }
     }
 
-    logger.debug(f"Object dimensions: {width:.2f} x {height:.2f} x {depth:.2f} Blender units")
-    logger.debug(f"Object center: ({center_x:.2f}, {center_y:.2f}, {center_z:.2f})")
-    logger.debug(f"Camera positioned at: ({camera.location.x:.2f}, {camera.location.y:.2f}, {camera.location.z:.2f})")
-    logger.debug(f"Fixed ortho_scale: {config.ortho_scale:.2f}")
-    logger.debug(f"Canvas size: {canvas_size}x{canvas_size}")
 
-    return canvas_size, metadata
+def calculate_canvas_and_position(bbox: Optional[Tuple[Vector, Vector]], camera: bpy.types.Object, config: RenderConfig,
+                                  yaw_deg: float, logger: logging.Logger) -> Tuple[int, dict]:
+    """
+    Calculate canvas size and position camera at object center using FIXED ortho_scale.
+    Center-center alignment: object center = canvas center.
+    Takes the model's precomputed compute_bbox() result so rotations don't re-walk meshes.
+    Returns canvas size and metadata dict.
+    """
+    if bbox is None:
+        return config.min_canvas_size, {}
+
+    center, dimensions = bbox
+    place_camera(camera, center, yaw_deg, config, logger)
+
+    return config.canvas_size, build_metadata(config.canvas_size, center, dimensions, config, logger)
 
 
 # ============================================================================
 # Metadata Export
 # ============================================================================
 
-def export_metadata(output_path: str, metadata: dict, logger: logging.Logger) -> bool:
-    """Export sprite metadata as JSON for Godot import automation"""
+# Sprite metadata collected per output directory until flush_manifest() writes it
+# (filled from the post-render I/O threads, hence the lock)
+_manifest: Dict[str, Dict[str, dict]] = {}
+_manifest_lock = threading.Lock()
+
+
+def export_metadata(output_path: str, metadata: dict, logger: logging.Logger, per_file: bool = False) -> bool:
+    """
+    Export sprite metadata for Godot import automation.
+    By default the entry is queued for the directory's _sprites.json manifest
+    (keyed by PNG file name); per_file writes a JSON sidecar next to the PNG instead.
+    """
+    if not per_file:
+        directory, filename = os.path.split(output_path)
+        with _manifest_lock:
+            _manifest.setdefault(directory, {})[filename] = metadata
+        return True
+
     try:
         # Metadata file path: same as PNG but with .json extension
         metadata_path = output_path.replace('.png', '.json')
@@ -387,7 +614,78 @@ def export_metadata(output_path: str, metadata: dict, logger: logging.Logger) ->
         return False
 
 
-def auto_crop_sprite(image_path: str, logger: logging.Logger) -> dict:
+def flush_manifest(logger: logging.Logger):
+    """Write queued metadata as one _sprites.json per directory, merged into any existing manifest"""
+    for directory, entries in _manifest.items():
+        manifest_path = os.path.join(directory, '_sprites.json')
+        try:
+            # Merge so re-runs with --skip-existing keep entries for sprites not rendered this time
+            manifest = {}
+            if os.path.exists(manifest_path):
+                with open(manifest_path, 'r') as f:
+                    manifest = json.load(f)
+            manifest.update(entries)
+
+            os.makedirs(directory, exist_ok=True)
+            with open(manifest_path, 'w') as f:
+                json.dump(manifest, f, indent=2, sort_keys=True)
+
+            logger.debug(f"Exported metadata: {manifest_path} ({len(entries)} sprites)")
+
+        except Exception as e:
+            logger.error(f"Failed to export metadata manifest {manifest_path}: {e}")
+
+    _manifest.clear()
+
+
+def alpha_bbox(pixels: 'np.ndarray') -> Optional[Tuple[int, int, int, int]]:
+    """
+    Bounding box (left, upper, right, lower) of non-transparent pixels in an
+    RGBA array, or None if fully transparent. Same convention as PIL getbbox().
+    """
+    alpha = pixels[..., 3]
+    rows = np.flatnonzero(alpha.any(axis=1))
+    if not rows.size:
+        return None
+    cols = np.flatnonzero(alpha.any(axis=0))
+    return int(cols[0]), int(rows[0]), int(cols[-1]) + 1, int(rows[-1]) + 1
+
+
+def crop_metadata(original_size: Tuple[int, int], bbox: Tuple[int, int, int, int], logger: logging.Logger) -> dict:
+    """Crop metadata for repositioning a cropped sprite in Godot"""
+    # Calculate offset and size
+    offset = {"x": bbox[0], "y": bbox[1]}
+    size = {"w": bbox[2] - bbox[0], "h": bbox[3] - bbox[1]}
+
+    logger.debug(f"Auto-cropped: {original_size[0]}×{original_size[1]} → {size['w']}×{size['h']} (offset: {offset['x']}, {offset['y']})")
+
+    return {
+        "original_size": {"w": original_size[0], "h": original_size[1]},
+        "crop_offset": offset,
+        "cropped_size": size
+    }
+
+
+def crop_and_save(pixels: 'np.ndarray', image_path: str, logger: logging.Logger, compress_level: int = 1) -> dict:
+    """
+    Crop an RGBA array to its visible pixels, save it as PNG and return crop metadata.
+    Fully transparent images are saved uncropped.
+    """
+    # Get bounding box of non-transparent pixels
+    bbox = alpha_bbox(pixels)
+
+    if not bbox:
+        logger.warning(f"No visible pixels found in {image_path}")
+        Image.fromarray(pixels).save(image_path, compress_level=compress_level)
+        return {}
+
+    # Crop to content and save (low zlib level: encode time dominates, size grows only slightly)
+    Image.fromarray(pixels[bbox[1]:bbox[3], bbox[0]:bbox[2]]).save(image_path, compress_level=compress_level)
+
+    return crop_metadata((pixels.shape[1], pixels.shape[0]), bbox, logger)
+
+
+def auto_crop_sprite(image_path: str, logger: logging.Logger, compress_level: int = 1) -> dict:
     """
     Crop transparent pixels from sprite and return crop metadata.
     Reduces file size and memory usage while preserving visual quality.
@@ -399,34 +697,21 @@ def auto_crop_sprite(image_path: str, logger: logging.Logger) -> dict:
         return {}
 
     try:
-        img = Image.open(image_path)
-        original_size = img.size
-
-        # Get bounding box of non-transparent pixels
-        bbox = img.getbbox()
-
-        if bbox:
-            # Crop to content
-            cropped = img.crop(bbox)
-
-            # Calculate offset and size
-            offset = {"x": bbox[0], "y": bbox[1]}
-            size = {"w": bbox[2] - bbox[0], "h": bbox[3] - bbox[1]}
-
-            # Save cropped image
-            cropped.save(image_path)
+        with Image.open(image_path) as img:
+            img = img.convert('RGBA')
 
-            logger.debug(f"Auto-cropped: {original_size[0]}×{original_size[1]} → {size['w']}×{size['h']} (offset: {offset['x']}, {offset['y']})")
+        if NUMPY_AVAILABLE:
+            return crop_and_save(np.asarray(img), image_path, logger, compress_level)
 
-            return {
-                "original_size": {"w": original_size[0], "h": original_size[1]},
-                "crop_offset": offset,
-                "cropped_size": size
-            }
-        else:
+        # Without NumPy, let Pillow find the bounding box
+        bbox = img.getbbox()
+        if not bbox:
             logger.warning(f"No visible pixels found in {image_path}")
             return {}
 
+        img.crop(bbox).save(image_path, compress_level=compress_level)
+        return crop_metadata(img.size, bbox, logger)
+
     except Exception as e:
         logger.error(f"Failed to auto-crop {image_path}: {e}")
         return {}
@@ -461,193 +746,376 @@ def render_sprite(output_path: str, logger: logging.Logger) -> bool:
         return False
 
 
+def viewer_pixels() -> 'np.ndarray':
+    """
+    Copy the last render from the compositor Viewer image as bottom-up float RGBA.
+    This is the only bpy access of the in-memory path; convert with to_rgba8 off the main thread.
+    """
+    image = bpy.data.images['Viewer Node']
+    width, height = image.size
+    pixels = np.empty(width * height * 4, dtype=np.float32)
+    image.pixels.foreach_get(pixels)
+    return pixels.reshape(height, width, 4)
+
+
+def to_rgba8(pixels: 'np.ndarray') -> 'np.ndarray':
+    """
+    Convert viewer_pixels() output to top-down 8-bit RGBA the way Blender's PNG
+    writer does it (straight alpha, sRGB 'Standard' view). Thread-safe (no bpy).
+    """
+    pixels = pixels[::-1]  # Blender stores rows bottom-up
+
+    # Un-premultiply, then apply the sRGB transfer function
+    rgb, alpha = pixels[..., :3], pixels[..., 3:]
+    rgb = np.clip(np.divide(rgb, alpha, out=np.zeros_like(rgb), where=alpha > 0), 0.0, 1.0)
+    rgb = np.where(rgb <= 0.0031308, rgb * 12.92, 1.055 * np.power(rgb, 1 / 2.4) - 0.055)
+
+    rgba = np.concatenate([rgb, np.clip(alpha, 0.0, 1.0)], axis=-1)
+    return (rgba * 255.0 + 0.5).astype(np.uint8)
+
+
+def render_sprite_to_memory(output_path: str, logger: logging.Logger) -> Optional['np.ndarray']:
+    """
+    Render the current scene without writing a file and return its raw float RGBA
+    pixels (see viewer_pixels), so the PNG is encoded once after cropping (instead of
+    write → read → crop → write). Returns None if rendering failed.
+    """
+    try:
+        # Ensure output directory exists
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+
+        # Render
+        bpy.ops.render.render(write_still=False)
+
+        logger.debug(f"Rendered successfully: {output_path}")
+        return viewer_pixels()
+
+    except Exception as e:
+        logger.error(f"Render failed: {e}")
+        return None
+
+
+def render_output(output_path: str, config: RenderConfig, logger: logging.Logger) -> Optional[Callable[[], dict]]:
+    """
+    Render one sprite on the main thread (bpy is not thread-safe).
+    Returns a callable doing the remaining crop/PNG work, safe to run on a worker
+    thread, which returns crop metadata; None if rendering failed.
+    """
+    compress_level = 0 if config.draft else config.png_compress_level
+
+    if config.auto_crop and PIL_AVAILABLE and NUMPY_AVAILABLE:
+        pixels = render_sprite_to_memory(output_path, logger)
+        if pixels is None:
+            return None
+        # The float -> 8-bit conversion is the costliest step; keep it off the main thread too
+        return lambda: crop_and_save(to_rgba8(pixels), output_path, logger, compress_level)
+
+    if not render_sprite(output_path, logger):
+        return None
+
+    # Auto-crop transparent pixels if enabled (warns when PIL is missing)
+    if config.auto_crop:
+        return lambda: auto_crop_sprite(output_path, logger, compress_level)
+    return lambda: {}
+
+
+def finish_sprite(finish: Callable[[], dict], output_path: str, metadata: dict,
+                  config: RenderConfig, logger: logging.Logger) -> bool:
+    """Crop/encode a rendered sprite and record its metadata (runs on the I/O thread pool)"""
+    try:
+        metadata.update(finish())
+    except Exception as e:
+        logger.error(f"Failed to save {output_path}: {e}")
+        return False
+
+    # Export metadata alongside sprite
+    export_metadata(output_path, metadata, logger, config.per_file_metadata)
+    logger.debug(f"  ✓ Rendered: {output_path}")
+    return True
+
+
 # ============================================================================
 # Batch Processing
 # ============================================================================
 
 def find_models(input_dir: str, formats: List[str]) -> List[Path]:
-    """Find all 3D model files in directory (recursive)"""
-    input_path = Path(input_dir)
-    models = []
+    """Find all 3D model files in directory (recursive, single pass for all formats)"""
+    # One case-insensitive pattern for every format (.GLTF dumps are common on Linux too)
+    pattern = re.compile(f"(?:{'|'.join(re.escape(fmt) for fmt in formats)})$", re.IGNORECASE)
 
-    for fmt in formats:
-        models.extend(input_path.rglob(f"*{fmt}"))
+    def walk(directory: str):
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            return  # Missing or unreadable directory: skip it, as Path.rglob does
 
-    return sorted(models)
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from walk(entry.path)
+            elif pattern.search(entry.name) and entry.is_file():
+                yield Path(entry.path)
 
+    return sorted(walk(input_dir))
 
-def process_batch(config: RenderConfig, logger: logging.Logger):
-    """Process all models in input directory"""
 
-    # Find all models
-    models = find_models(config.input_dir, config.formats)
+def collect_finished(pending: list, stats: dict, logger: logging.Logger, wait_all: bool, max_pending: int = 4):
+    """
+    Account for models whose post-render I/O has finished, in submission order.
+    Blocks on the oldest model while more than max_pending are queued (or on all with wait_all).
+    """
+    while pending:
+        saved_message, sprites, success = pending[0]
+        if not wait_all and len(pending) <= max_pending and not all(f.done() for _, f in sprites):
+            break
+        pending.pop(0)
 
-    if not models:
-        logger.error(f"No models found in {config.input_dir}")
-        return
+        for label, future in sprites:
+            if not future.result():
+                success = False
+                stats["failed"] += 1
+                stats["failed_files"].append(label)
 
-    logger.info(f"Found {len(models)} models to process")
+        if success:
+            stats["processed"] += 1
+            logger.info(saved_message)
+
+
+def render_models(models: List[Path], config: RenderConfig, logger: logging.Logger) -> dict:
+    """Render a list of models in this Blender session and return batch statistics"""
 
     # Setup scene once
     logger.info("Setting up scene...")
     clear_scene()
+    configure_batch_mode()
     camera = setup_camera(config)
     light = setup_lighting(config)
-    setup_render_settings(config)
+    setup_render_settings(config, logger)
 
     # Statistics
-    processed = 0
-    skipped = 0
-    failed = 0
-    failed_files = []
+    stats = {"total": len(models), "processed": 0, "skipped": 0, "failed": 0, "failed_files": []}
 
     input_path = Path(config.input_dir)
     output_path = Path(config.output_dir)
 
-    # Process each model
-    for idx, model_path in enumerate(models, 1):
-        # Calculate relative path to preserve directory structure
-        rel_path = model_path.relative_to(input_path)
-        output_file = output_path / rel_path.with_suffix('.png')
-
-        logger.info(f"[{idx}/{len(models)}] Processing: {rel_path}")
-
-        # Skip if output exists and skip_existing is enabled
-        if config.skip_existing and output_file.exists():
-            logger.info(f"  Skipping (already exists): {output_file}")
-            skipped += 1
-            continue
-
-        # Clear previous objects (keep camera and light)
-        for obj in bpy.context.scene.objects:
-            if obj.type == 'MESH' or obj.type == 'EMPTY':
-                obj.select_set(True)
-            else:
-                obj.select_set(False)
-        bpy.ops.object.delete()
-
-        # Import model
-        if not import_model(str(model_path), config.scale_factor, logger):
-            failed += 1
-            failed_files.append(str(rel_path))
-            continue
-
-        # Render with rotations if enabled
-        if config.rotations == 4:
-            # Render 4 directional sprites (N/S/E/W)
-            # With fixed ortho_scale, canvas size is consistent across all rotations
-            rotations = [
-                (0, '_s', 'South'),
-                (90, '_e', 'East'),
-                (180, '_n', 'North'),
-                (270, '_w', 'West')
-            ]
-
-            # Save original camera yaw to restore after rotations
-            original_yaw = config.camera_yaw
-
-            render_success = True
-            for angle, suffix, direction in rotations:
+    # Crop, PNG encode and metadata run on background threads (Pillow releases the GIL),
+    # overlapping with the next model's import and render on the main thread
+    pending: List[Tuple[str, List[Tuple[str, Future]], bool]] = []
+
+    with ThreadPoolExecutor(max_workers=2) as io_pool:
+        # Process each model
+        for idx, model_path in enumerate(models, 1):
+            collect_finished(pending, stats, logger, wait_all=False)
+
+            # Calculate relative path to preserve directory structure
+            rel_path = model_path.relative_to(input_path)
+            output_file = output_path / rel_path.with_suffix('.png')
+
+            logger.info(f"[{idx}/{len(models)}] Processing: {rel_path}")
+
+            # Skip if output exists and skip_existing is enabled
+            if config.skip_existing and output_file.exists():
+                logger.info(f"  Skipping (already exists): {output_file}")
+                stats["skipped"] += 1
+                continue
+
+            # Clear previous objects (keep camera and light)
+            for obj in [o for o in bpy.context.scene.objects if o.type in {'MESH', 'EMPTY', 'ARMATURE'}]:
+                bpy.data.objects.remove(obj, do_unlink=True)
+
+            # Free meshes/materials/images left behind by removed objects in periodic batches
+            if idx % config.orphan_purge_interval == 0:
+                bpy.data.orphans_purge(do_recursive=True)
+
+            # Import model
+            cache_dir = config.import_cache_dir if config.import_cache else None
+            if not import_model(str(model_path), config.scale_factor, logger, cache_dir):
+                stats["failed"] += 1
+                stats["failed_files"].append(str(rel_path))
+                continue
+
+            # Render with rotations if enabled: (camera yaw, rotation_degrees, suffix, direction)
+            if config.rotations == 4:
+                # Render 4 directional sprites (N/S/E/W)
                 # Rotate CAMERA around model instead of rotating the model
                 # This shows the "proper" face from each direction
-                logger.debug(f"  Rotating camera to {angle}° for {direction}")
-
-                # Temporarily update camera yaw for this rotation
-                config.camera_yaw = angle
+                rotations = [
+                    (0, 0, '_s', 'South'),
+                    (90, 90, '_e', 'East'),
+                    (180, 180, '_n', 'North'),
+                    (270, 270, '_w', 'West')
+                ]
+                saved_message = f"  ✓ Saved 4 rotations to: {output_file.parent}/{output_file.stem}_*.png"
+            else:
+                # Single render (south-facing by default) at the configured camera yaw
+                rotations = [(config.camera_yaw, 0, '', 'South')]
+                saved_message = f"  ✓ Saved: {output_file}"
+
+            # Geometry is identical for every rotation: evaluate the scene and compute
+            # the bounding box once per model, then only move the camera per direction
+            bpy.context.view_layer.update()
+            bbox = compute_bbox(scene_meshes())
+            if bbox is None:
+                logger.warning("No mesh objects found to frame")
+
+            sprites = []
+            render_success = True
 
-                # Force complete depsgraph update to propagate transforms
-                bpy.context.view_layer.update()
-                depsgraph = bpy.context.evaluated_depsgraph_get()
-                depsgraph.update()
+            for yaw, rotation_degrees, suffix, direction in rotations:
+                logger.debug(f"  Rotating camera to {yaw}° for {direction}")
 
-                # Calculate canvas and position camera (fixed ortho_scale = consistent canvas size)
-                canvas_size, metadata = calculate_canvas_and_position(camera, config, logger)
+                # Position camera (fixed ortho_scale = consistent canvas size)
+                canvas_size, metadata = calculate_canvas_and_position(bbox, camera, config, yaw, logger)
 
                 # Add rotation info to metadata
-                metadata['rotation_degrees'] = angle
+                metadata['rotation_degrees'] = rotation_degrees
                 metadata['direction'] = direction
 
                 # Generate output path with suffix
-                rotated_output = str(output_file).replace('.png', f'{suffix}.png')
+                sprite_output = str(output_file).replace('.png', f'{suffix}.png')
+                label = f"{rel_path} ({direction})" if config.rotations == 4 else str(rel_path)
 
-                if not render_sprite(rotated_output, logger):
+                finish = render_output(sprite_output, config, logger)
+                if finish is None:
                     render_success = False
-                    failed += 1
-                    failed_files.append(f"{rel_path} ({direction})")
-                    logger.error(f"  ✗ Failed {direction}: {rotated_output}")
+                    stats["failed"] += 1
+                    stats["failed_files"].append(label)
+                    logger.error(f"  ✗ Failed {direction}: {sprite_output}")
                 else:
-                    # Auto-crop transparent pixels if enabled
-                    if config.auto_crop:
-                        crop_meta = auto_crop_sprite(rotated_output, logger)
-                        metadata.update(crop_meta)
+                    future = io_pool.submit(finish_sprite, finish, sprite_output, metadata, config, logger)
+                    sprites.append((label, future))
 
-                    # Export metadata alongside sprite
-                    export_metadata(rotated_output, metadata, logger)
-                    logger.debug(f"  ✓ Rendered {direction}: {rotated_output}")
+            pending.append((saved_message, sprites, render_success))
 
-            # Restore original camera yaw
-            config.camera_yaw = original_yaw
+        collect_finished(pending, stats, logger, wait_all=True)
+
+    return stats
 
-            if render_success:
-                processed += 1
-                logger.info(f"  ✓ Saved 4 rotations to: {output_file.parent}/{output_file.stem}_*.png")
-        else:
-            # Single render (south-facing by default)
-            # Calculate canvas and position camera
-            canvas_size, metadata = calculate_canvas_and_position(camera, config, logger)
-
-            # Add rotation info (single render defaults to south-facing)
-            metadata['rotation_degrees'] = 0
-            metadata['direction'] = 'South'
-
-            if render_sprite(str(output_file), logger):
-                # Auto-crop transparent pixels if enabled
-                if config.auto_crop:
-                    crop_meta = auto_crop_sprite(str(output_file), logger)
-                    metadata.update(crop_meta)
-
-                # Export metadata alongside sprite
-                export_metadata(str(output_file), metadata, logger)
-                processed += 1
-                logger.info(f"  ✓ Saved: {output_file}")
-            else:
-                failed += 1
-                failed_files.append(str(rel_path))
-                logger.error(f"  ✗ Failed: {output_file}")
 
-    # Summary
+def run_shards(models: List[Path], jobs: int, config: RenderConfig, logger: logging.Logger) -> dict:
+    """
+    Split models across parallel headless Blender workers and merge their statistics.
+    Each worker re-runs this script with the same arguments plus --worker-shard,
+    reads its model list from a JSON file and writes its statistics back as JSON.
+    """
+    stats = {"total": len(models), "processed": 0, "skipped": 0, "failed": 0, "failed_files": []}
+
+    with tempfile.TemporaryDirectory(prefix="sprite_shards_") as shard_dir:
+        workers = []
+        for index in range(jobs):
+            # Round-robin keeps neighbouring (often similar-sized) models on different workers
+            shard = [str(m) for m in models[index::jobs]]
+            with open(os.path.join(shard_dir, f"models_shard_{index}.json"), 'w') as f:
+                json.dump(shard, f)
+
+            cmd = [
+                bpy.app.binary_path, '--background', '--python-exit-code', '1',
+                '--python', os.path.abspath(__file__), '--',
+                *script_arguments(),
+                '--worker-shard', f"{index}/{jobs}",
+                '--shard-dir', shard_dir
+            ]
+            logger.debug(f"Starting shard {index + 1}/{jobs}: {len(shard)} models")
+            workers.append((index, shard, subprocess.Popen(cmd)))
+
+        logger.info(f"Rendering with {jobs} parallel Blender workers...")
+
+        for index, shard, proc in workers:
+            returncode = proc.wait()
+            result_path = os.path.join(shard_dir, f"result_shard_{index}.json")
+
+            if not os.path.exists(result_path):
+                logger.error(f"Shard {index + 1}/{jobs} exited with code {returncode} without results")
+                stats["failed"] += len(shard)
+                stats["failed_files"].extend(f"{m} (worker crashed)" for m in shard)
+                continue
+
+            with open(result_path, 'r') as f:
+                result = json.load(f)
+            for key in ("processed", "skipped", "failed"):
+                stats[key] += result[key]
+            stats["failed_files"].extend(result["failed_files"])
+
+            # Workers hand their metadata back so each manifest is written by one process
+            for directory, entries in result["manifest"].items():
+                _manifest.setdefault(directory, {}).update(entries)
+
+    return stats
+
+
+def log_summary(stats: dict, logger: logging.Logger):
+    """Log the end-of-batch summary"""
     logger.info("")
     logger.info("=" * 60)
     logger.info("BATCH RENDER COMPLETE")
     logger.info("=" * 60)
-    logger.info(f"Total models found: {len(models)}")
-    logger.info(f"Successfully processed: {processed}")
-    logger.info(f"Skipped (existing): {skipped}")
-    logger.info(f"Failed: {failed}")
+    logger.info(f"Total models found: {stats['total']}")
+    logger.info(f"Successfully processed: {stats['processed']}")
+    logger.info(f"Skipped (existing): {stats['skipped']}")
+    logger.info(f"Failed: {stats['failed']}")
 
-    if failed_files:
+    if stats["failed_files"]:
         logger.info("")
         logger.info("Failed files:")
-        for f in failed_files:
+        for f in stats["failed_files"]:
             logger.info(f"  - {f}")
 
     logger.info("=" * 60)
 
 
+def process_batch(config: RenderConfig, logger: logging.Logger):
+    """Process all models in input directory"""
+
+    # Shard worker: render only the models handed over by the parent process
+    if config.worker_shard:
+        index, count = config.worker_shard
+        with open(os.path.join(config.shard_dir, f"models_shard_{index}.json"), 'r') as f:
+            models = [Path(p) for p in json.load(f)]
+
+        logger.info(f"Worker {index + 1}/{count}: {len(models)} models to process")
+        stats = render_models(models, config, logger)
+        stats["manifest"] = _manifest
+
+        with open(os.path.join(config.shard_dir, f"result_shard_{index}.json"), 'w') as f:
+            json.dump(stats, f)
+        return
+
+    # Find all models
+    models = find_models(config.input_dir, config.formats)
+
+    if not models:
+        logger.error(f"No models found in {config.input_dir}")
+        return
+
+    logger.info(f"Found {len(models)} models to process")
+
+    jobs = min(config.jobs or os.cpu_count() or 1, len(models))
+    if jobs > 1:
+        stats = run_shards(models, jobs, config, logger)
+    else:
+        stats = render_models(models, config, logger)
+
+    flush_manifest(logger)
+    log_summary(stats, logger)
+
+
 # ============================================================================
 # CLI Argument Parsing
 # ============================================================================
 
+def script_arguments() -> List[str]:
+    """Return the arguments after '--' (everything before is for Blender)"""
+    argv = sys.argv
+    if '--' in argv:
+        return argv[argv.index('--') + 1:]
+    return []
+
+
 def parse_arguments() -> RenderConfig:
     """Parse command-line arguments"""
 
     # Arguments after '--' are for this script
-    # (everything before is for Blender)
-    argv = sys.argv
-    if '--' in argv:
-        argv = argv[argv.index('--') + 1:]
-    else:
-        argv = []
+    argv = script_arguments()
 
     parser = argparse.ArgumentParser(
         description='Batch render 3D models to 2D isometric sprites',
@@ -666,6 +1134,10 @@ Examples:
   # Load from config file
   blender --background --python blender_batch_render.py -- \\
       --config render_config.json
+
+  # Render with one Blender worker per CPU core
+  blender --background --python blender_batch_render.py -- \\
+      --input ./models --output ./sprites --jobs 0
         """
     )
 
@@ -683,6 +1155,12 @@ Examples:
                         help='Fixed orthographic scale in Blender units (default: 8.0)')
     parser.add_argument('--samples', '-s', type=int,
                         help='Anti-aliasing samples (higher = smoother, slower)')
+    parser.add_argument('--engine', choices=['eevee', 'cycles'],
+                        help='Render engine (default: eevee; cycles can be faster on GPUs for dense meshes)')
+    parser.add_argument('--device', choices=['CPU', 'CUDA', 'OPTIX', 'HIP', 'METAL', 'ONEAPI'],
+                        help='Cycles compute device (default: OPTIX)')
+    parser.add_argument('--no-persistent-data', action='store_true',
+                        help='Free render data after every render (lower memory use, slower)')
     parser.add_argument('--pixels-per-unit', type=float,
                         help='Pixels per Blender unit for real-world scaling (default: 128)')
     parser.add_argument('--rotations', type=int, choices=[1, 4],
@@ -695,6 +1173,23 @@ Examples:
                         help='Skip files that already exist in output directory')
     parser.add_argument('--no-auto-crop', action='store_true',
                         help='Disable automatic cropping of transparent pixels')
+    parser.add_argument('--png-compress-level', type=int, choices=range(10), metavar='0-9',
+                        help='PNG zlib level (default: 1). Levels 1-3 encode several times faster than 9 '
+                             'for files only ~10-30%% larger; 0 stores uncompressed')
+    parser.add_argument('--draft', action='store_true',
+                        help='Fast preview renders: max 16 samples, no ambient occlusion/bloom, uncompressed PNG')
+    parser.add_argument('--no-import-cache', action='store_true',
+                        help='Always run the model importer instead of reusing cached .blend imports')
+    parser.add_argument('--import-cache-dir', type=str,
+                        help='Directory for cached .blend imports (default: ~/.cache/blender-sprite-render/imports)')
+    parser.add_argument('--per-file-metadata', action='store_true',
+                        help='Write a JSON sidecar per sprite instead of one _sprites.json manifest per directory')
+    parser.add_argument('--jobs', '-j', type=int,
+                        help='Parallel Blender worker processes (0 = one per CPU core, default: 1)')
+    parser.add_argument('--worker-shard', type=str,
+                        help=argparse.SUPPRESS)  # internal: "i/N" shard handled by a worker process
+    parser.add_argument('--shard-dir', type=str,
+                        help=argparse.SUPPRESS)  # internal: directory with shard model lists
     parser.add_argument('--verbose', '-v', action='store_true',
                         help='Enable verbose logging')
     parser.add_argument('--log-file', type=str,
@@ -730,6 +1225,12 @@ Examples:
         config.ortho_scale = args.ortho_scale
     if args.samples:
         config.samples = args.samples
+    if args.engine:
+        config.engine = args.engine
+    if args.device:
+        config.device = args.device
+    if args.no_persistent_data:
+        config.persistent_data = False
     if args.pixels_per_unit:
         config.pixels_per_unit = args.pixels_per_unit
     if args.rotations:
@@ -742,14 +1243,43 @@ Examples:
         config.skip_existing = True
     if args.no_auto_crop:
         config.auto_crop = False
+    if args.png_compress_level is not None:
+        config.png_compress_level = args.png_compress_level
+    if args.draft:
+        config.draft = True
+    if args.no_import_cache:
+        config.import_cache = False
+    if args.import_cache_dir:
+        config.import_cache_dir = args.import_cache_dir
+    if args.per_file_metadata:
+        config.per_file_metadata = True
+    if args.jobs is not None:
+        config.jobs = args.jobs
     if args.verbose:
         config.verbose = True
     if args.log_file:
         config.log_file = args.log_file
 
+    # Worker processes: render one shard and keep their own log file
+    if args.worker_shard:
+        index, count = (int(n) for n in args.worker_shard.split('/'))
+        config.worker_shard = (index, count)
+        config.shard_dir = args.shard_dir
+        if config.log_file:
+            root, ext = os.path.splitext(config.log_file)
+            config.log_file = f"{root}.shard{index}{ext}"
+
     # Validate
     if not config.input_dir:
         parser.error("--input is required")
+    if config.engine not in ('eevee', 'cycles'):
+        parser.error("engine must be 'eevee' or 'cycles'")
+    if config.jobs < 0:
+        parser.error("--jobs must be 0 (auto) or a positive number")
+    if not isinstance(config.orphan_purge_interval, int) or config.orphan_purge_interval < 1:
+        parser.error("orphan_purge_interval must be a positive integer")
+    if config.worker_shard and not config.shard_dir:
+        parser.error("--worker-shard requires --shard-dir")
 
     return config
 
@@ -763,18 +1293,23 @@ def main():
     config = parse_arguments()
     logger = setup_logging(config)
 
-    logger.info("Blender Batch 3D-to-2D Sprite Renderer (Angled Top-Down)")
-    logger.info(f"Input: {config.input_dir}")
-    logger.info(f"Output: {config.output_dir}")
-    logger.info(f"Camera angle: {config.camera_angle}° (55° = classic, 90° = pure top-down)")
-    logger.info(f"Camera yaw: {config.camera_yaw}° (0° = north-facing)")
-    logger.info(f"Ortho scale: {config.ortho_scale} Blender units (FIXED)")
-    logger.info(f"Pixels per unit: {config.pixels_per_unit}")
-    logger.info(f"Scale factor: {config.scale_factor}× (import scaling)")
-    logger.info(f"Samples: {config.samples}")
-    logger.info(f"Rotations: {config.rotations}")
-    logger.info(f"Auto-crop: {'enabled' if config.auto_crop else 'disabled'}")
-    logger.info("")
+    # Workers skip the banner; the parent process already printed it
+    if not config.worker_shard:
+        logger.info("Blender Batch 3D-to-2D Sprite Renderer (Angled Top-Down)")
+        logger.info(f"Input: {config.input_dir}")
+        logger.info(f"Output: {config.output_dir}")
+        logger.info(f"Camera angle: {config.camera_angle}° (55° = classic, 90° = pure top-down)")
+        logger.info(f"Camera yaw: {config.camera_yaw}° (0° = north-facing)")
+        logger.info(f"Ortho scale: {config.ortho_scale} Blender units (FIXED)")
+        logger.info(f"Pixels per unit: {config.pixels_per_unit}")
+        logger.info(f"Scale factor: {config.scale_factor}× (import scaling)")
+        logger.info(f"Engine: {config.engine}{f' ({config.device})' if config.engine == 'cycles' else ''}")
+        logger.info(f"Samples: {config.samples}{' (draft: max 16)' if config.draft else ''}")
+        logger.info(f"Rotations: {config.rotations}")
+        # Pillow version shows whether the Pillow-SIMD build is in use (e.g. 9.5.0.post1)
+        logger.info(f"Auto-crop: {f'enabled (Pillow {Image.__version__})' if config.auto_crop and PIL_AVAILABLE else 'disabled'}")
+        logger.info(f"Jobs: {config.jobs if config.jobs else f'auto ({os.cpu_count()})'}")
+        logger.info("")
 
     process_batch(config, logger)
 
@@ -2,34 +2,350 @@
 """
 Quick script to inspect Blender Unit sizes of 3D models
 Usage: blender --background --python inspect_model_sizes.py -- <model_path1> <model_path2> ...
+       blender --background --python inspect_model_sizes.py -- --manifest <paths.txt>
+
+A manifest is a text file with one model path per line. All models are inspected
+in a single Blender session, so Blender's startup cost is paid once, e.g.:
+    find ./models -name '*.glb' > paths.txt
+
+glTF/GLB bounding boxes are read from the file's JSON (accessor min/max plus node
+transforms) and OBJ bounding boxes from its vertex lines, without importing; pass
+--full-import to always use Blender's importers.
+
+Results are cached in ~/.cache/blender-sprite-render/bbox.json keyed by the SHA-1 of
+each file and the measurement mode (direct read or --full-import), so unchanged models
+are not measured again; pass --no-cache to bypass it.
+
+Run with plain Python instead of Blender to spread the models over parallel
+background Blender workers:
+    python inspect_model_sizes.py --jobs 8 ./models/*.glb
 """
 
-import bpy
+import hashlib
+import importlib.util
+import itertools
+import json
+import mmap
+import os
+import re
+import struct
+import subprocess
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from mathutils import Vector
+from typing import TYPE_CHECKING, Optional, Tuple
+
+# bpy and numpy are imported where they are used, so usage errors and the
+# plain-Python orchestrator never pay for them
+if TYPE_CHECKING:
+    import numpy as np
+
+BBOX_CACHE_PATH = Path.home() / '.cache' / 'blender-sprite-render' / 'bbox.json'
+
+def load_cache(path: Path) -> dict:
+    """Load cached bounding boxes (empty when missing or unreadable)"""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_cache(path: Path, cache: dict):
+    """Write cached bounding boxes"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(cache, f)
+
+def file_sha1(filepath: str) -> str:
+    """SHA-1 of a file's contents"""
+    with open(filepath, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+            return hashlib.file_digest(f, 'sha1').hexdigest()
+        digest = hashlib.sha1()
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+def cache_key(filepath: str, full_import: bool) -> str:
+    """Cache key: file hash plus measurement mode, as imports and direct reads can differ"""
+    return f"{file_sha1(filepath)}:{'import' if full_import else 'direct'}"
 
 def clear_scene():
-    """Remove all objects from the scene"""
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete()
+    """Remove all objects and their mesh/material/image data (no operator or undo overhead)"""
+    import bpy
+
+    for collection in (bpy.data.objects, bpy.data.meshes, bpy.data.materials, bpy.data.images, bpy.data.textures):
+        for item in list(collection):
+            collection.remove(item, do_unlink=True)
+
+def _read_gltf_json(filepath: str) -> dict:
+    """Return the JSON document of a .gltf file or the JSON chunk of a .glb"""
+    with open(filepath, 'rb') as f:
+        if not filepath.lower().endswith('.glb'):
+            return json.load(f)
+
+        # 12-byte header (magic, version, length), then the JSON chunk (length, type)
+        magic, _version, _length = struct.unpack('<4sII', f.read(12))
+        chunk_length, chunk_type = struct.unpack('<I4s', f.read(8))
+        if magic != b'glTF' or chunk_type != b'JSON':
+            raise ValueError("not a binary glTF file")
+        return json.loads(f.read(chunk_length))
+
+def _node_matrix(node: dict) -> 'np.ndarray':
+    """Local 4x4 transform of a glTF node (column-major matrix or TRS)"""
+    import numpy as np
+
+    if 'matrix' in node:
+        return np.array(node['matrix'], dtype=np.float64).reshape(4, 4).T
+
+    x, y, z, w = node.get('rotation', (0.0, 0.0, 0.0, 1.0))
+    rotation = np.array([
+        [1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)],
+        [2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)],
+        [2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)],
+    ])
+    matrix = np.eye(4)
+    matrix[:3, :3] = rotation * np.array(node.get('scale', (1.0, 1.0, 1.0)))
+    matrix[:3, 3] = node.get('translation', (0.0, 0.0, 0.0))
+    return matrix
+
+# Divisors for normalized integer accessors (BYTE, UNSIGNED_BYTE, SHORT, UNSIGNED_SHORT)
+_NORMALIZED_DIVISORS = {5120: 127.0, 5121: 255.0, 5122: 32767.0, 5123: 65535.0}
+
+def _bbox_from_gltf(filepath: str) -> Optional[Tuple['np.ndarray', 'np.ndarray', int]]:
+    """
+    Bounding box of a glTF/GLB from its JSON alone, in Blender's Z-up axes.
+
+    Returns (min, max, mesh_count), or None when the file has no meshes or a
+    POSITION accessor lacks min/max, in which case the caller imports instead.
+    """
+    import numpy as np
+
+    gltf = _read_gltf_json(filepath)
+    nodes = gltf.get('nodes', [])
+    meshes = gltf.get('meshes', [])
+    accessors = gltf.get('accessors', [])
+
+    scenes = gltf.get('scenes')
+    if scenes:
+        roots = scenes[gltf.get('scene', 0)].get('nodes', [])
+    else:
+        children = {child for node in nodes for child in node.get('children', ())}
+        roots = [i for i in range(len(nodes)) if i not in children]
+
+    boxes = []
+    mesh_count = 0
+    stack = [(index, np.eye(4)) for index in roots]
+    while stack:
+        index, parent = stack.pop()
+        node = nodes[index]
+        world = parent @ _node_matrix(node)
+        stack.extend((child, world) for child in node.get('children', ()))
+
+        if 'mesh' not in node:
+            continue
+        mesh_count += 1
+        for primitive in meshes[node['mesh']]['primitives']:
+            accessor = accessors[primitive['attributes']['POSITION']]
+            if 'min' not in accessor or 'max' not in accessor:
+                return None
+            lo = np.array(accessor['min'][:3], dtype=np.float64)
+            hi = np.array(accessor['max'][:3], dtype=np.float64)
+            if accessor.get('normalized'):
+                divisor = _NORMALIZED_DIVISORS.get(accessor.get('componentType'), 1.0)
+                lo = np.maximum(lo / divisor, -1.0)
+                hi = np.maximum(hi / divisor, -1.0)
+
+            corners = np.ones((8, 4))
+            corners[:, :3] = list(itertools.product(*zip(lo, hi)))
+            boxes.append(np.einsum('ij,kj->ki', world, corners)[:, :3])
+
+    if not boxes:
+        return None
+
+    points = np.concatenate(boxes)
+    mn, mx = points.min(axis=0), points.max(axis=0)
+
+    # glTF is Y-up; Blender's importer maps (x, y, z) to (x, -z, y)
+    return (np.array([mn[0], -mx[2], mn[1]]),
+            np.array([mx[0], -mn[2], mx[1]]),
+            mesh_count)
+
+_OBJ_VERTEX = re.compile(rb'^v[ \t]+(\S+)[ \t]+(\S+)[ \t]+(\S+)', re.MULTILINE)
+_OBJ_OBJECT = re.compile(rb'^o[ \t]', re.MULTILINE)
+
+def _bbox_from_obj(filepath: str) -> Optional[Tuple['np.ndarray', 'np.ndarray', int]]:
+    """
+    Bounding box of an OBJ from its `v` lines alone, in Blender's Z-up axes.
+
+    Returns (min, max, object_count), or None when the file has no vertices.
+    """
+    import numpy as np
+
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            vertices = _OBJ_VERTEX.findall(mm)
+            object_count = max(1, len(_OBJ_OBJECT.findall(mm)))
+
+    if not vertices:
+        return None
+
+    co = np.array(vertices).astype(np.float64)
+    mn, mx = co.min(axis=0), co.max(axis=0)
+
+    # OBJ has no transforms; Blender's importer maps Y-up (x, y, z) to (x, -z, y)
+    return (np.array([mn[0], -mx[2], mn[1]]),
+            np.array([mx[0], -mn[2], mx[1]]),
+            object_count)
+
+# Formats whose bounds can be read from the file without a Blender import
+BBOX_READERS = {'.gltf': _bbox_from_gltf, '.glb': _bbox_from_gltf, '.obj': _bbox_from_obj}
+
+def inspect_model(filepath: str, full_import: bool = False, cache: Optional[dict] = None,
+                  fast: bool = False) -> dict:
+    """
+    Return a model's bounding box dimensions, from the cache when it has them.
+    Only exact (non --fast) measurements are stored in the cache.
+    """
+    p = Path(filepath)
+    name = p.name
+    ext = p.suffix.lower()
+    print(f"\nInspecting: {name}")
+
+    key = None
+    if cache is not None:
+        try:
+            key = cache_key(filepath, full_import)
+        except OSError as e:
+            print(f"  ❌ Failed to read: {e}")
+            return None
+        entry = cache.get(key)
+        if entry:
+            print(f"  Bounding box: {entry['width']:.3f} × {entry['height']:.3f} × {entry['depth']:.3f} BU (cached)")
+            print(f"  Max dimension: {entry['max']:.3f} BU")
+            return {"file": name, **entry}
+
+    result = measure_model(filepath, name, ext, full_import, fast)
+    if result and key and not fast:
+        cache[key] = {k: result[k] for k in ("width", "height", "depth", "max")}
+    return result
+
+def _bbox_numpy(fast: bool) -> Tuple['np.ndarray', 'np.ndarray', int]:
+    """
+    World-space bounding box of every mesh instance in the evaluated scene,
+    including collection and particle instances. Returns (min, max, instance_count).
+
+    Vertices are read once per unique evaluated mesh. Objects are measured from
+    their vertices (tight); instances from the 8 corners of their mesh's local
+    box, so many copies of one mesh cost only a corner transform each.
+    """
+    import bpy
+    import numpy as np
+
+    mn = np.full(3, np.inf)
+    mx = np.full(3, -np.inf)
+
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    local = {}  # evaluated mesh pointer -> (local points, local box corners) or None
+    instance_count = 0
+
+    for inst in depsgraph.object_instances:
+        obj = inst.object
+        if obj.type != 'MESH':
+            continue
+        instance_count += 1
+
+        key = obj.data.as_pointer()
+        if key not in local:
+            if fast:
+                # Looser local bound_box corners instead of evaluated vertices
+                co = np.array([tuple(corner) for corner in obj.bound_box])
+            else:
+                mesh = obj.to_mesh()
+                try:
+                    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+                    mesh.vertices.foreach_get('co', co)
+                finally:
+                    obj.to_mesh_clear()
+                co = co.reshape(-1, 3)
+            if co.size:
+                corners = np.array(list(itertools.product(*zip(co.min(axis=0), co.max(axis=0)))))
+                local[key] = (co, corners)
+            else:
+                local[key] = None
+
+        if local[key] is None:
+            continue
+        co, corners = local[key]
+        points = corners if inst.is_instance else co
+
+        matrix = np.array(inst.matrix_world)
+        world = points @ matrix[:3, :3].T + matrix[:3, 3]
+        np.minimum(mn, world.min(axis=0), out=mn)
+        np.maximum(mx, world.max(axis=0), out=mx)
+
+    return mn, mx, instance_count
+
+def _bbox_python(meshes: list) -> Tuple[tuple, tuple]:
+    """World-space bounding box of mesh object bound boxes, without numpy"""
+    from mathutils import Vector
+
+    inf = float('inf')
+    mn = (inf, inf, inf)
+    mx = (-inf, -inf, -inf)
+
+    for obj in meshes:
+        mw = obj.matrix_world
+        corners = obj.bound_box
+        for corner in corners:
+            x, y, z = mw @ Vector(corner)
+            mn = (min(mn[0], x), min(mn[1], y), min(mn[2], z))
+            mx = (max(mx[0], x), max(mx[1], y), max(mx[2], z))
 
-def inspect_model(filepath: str) -> dict:
+    return mn, mx
+
+# Importer options that skip images, animation and custom properties, none of which
+# affect the bounding box. Options a Blender version lacks are dropped (see _run_importer).
+GLTF_IMPORT_OPTIONS = {"import_pack_images": False}
+FBX_IMPORT_OPTIONS = {"use_image_search": False, "use_anim": False, "use_custom_props": False}
+OBJ_IMPORT_OPTIONS = {"use_image_search": False, "use_split_groups": False}
+
+def _run_importer(operator, filepath: str, options: dict):
+    """Run an import operator with the options this Blender version supports"""
+    supported = operator.get_rna_type().properties.keys()
+    operator(filepath=filepath, **{k: v for k, v in options.items() if k in supported})
+
+def measure_model(filepath: str, name: str, ext: str, full_import: bool = False,
+                  fast: bool = False) -> dict:
     """Load a model and return its bounding box dimensions"""
-    print(f"\nInspecting: {Path(filepath).name}")
+    import bpy
+
+    # The direct readers and the vertex path need numpy
+    numpy_available = importlib.util.find_spec('numpy') is not None
+
+    if ext in BBOX_READERS and not full_import and numpy_available:
+        try:
+            bbox = BBOX_READERS[ext](filepath)
+        except (OSError, ValueError, KeyError, IndexError, TypeError, struct.error) as e:
+            print(f"  ⚠️  Could not read bounds from file ({e}), importing instead")
+            bbox = None
+        if bbox is not None:
+            return _report(name, *bbox)
 
     # Clear scene
     clear_scene()
 
     # Import model
-    ext = Path(filepath).suffix.lower()
     try:
         if ext in ['.gltf', '.glb']:
-            bpy.ops.import_scene.gltf(filepath=filepath)
+            _run_importer(bpy.ops.import_scene.gltf, filepath, GLTF_IMPORT_OPTIONS)
         elif ext == '.obj':
-            bpy.ops.import_scene.obj(filepath=filepath)
+            _run_importer(bpy.ops.import_scene.obj, filepath, OBJ_IMPORT_OPTIONS)
         elif ext == '.fbx':
-            bpy.ops.import_scene.fbx(filepath=filepath)
+            _run_importer(bpy.ops.import_scene.fbx, filepath, FBX_IMPORT_OPTIONS)
         else:
             print(f"  ⚠️  Unsupported format: {ext}")
             return None
@@ -38,86 +354,288 @@ def inspect_model(filepath: str) -> dict:
         return None
 
     # Calculate bounding box
-    min_x = min_y = min_z = float('inf')
-    max_x = max_y = max_z = float('-inf')
-
-    mesh_count = 0
-    for obj in bpy.context.scene.objects:
-        if obj.type == 'MESH':
-            mesh_count += 1
-            for corner in obj.bound_box:
-                world_coord = obj.matrix_world @ Vector(corner)
-                min_x = min(min_x, world_coord.x)
-                max_x = max(max_x, world_coord.x)
-                min_y = min(min_y, world_coord.y)
-                max_y = max(max_y, world_coord.y)
-                min_z = min(min_z, world_coord.z)
-                max_z = max(max_z, world_coord.z)
+    if numpy_available:
+        mn, mx, mesh_count = _bbox_numpy(fast)
+    else:
+        meshes = [obj for obj in bpy.context.scene.objects if obj.type == 'MESH']
+        mesh_count = len(meshes)
+        mn, mx = _bbox_python(meshes)
 
     if mesh_count == 0:
         print("  ⚠️  No mesh objects found")
         return None
 
-    # Calculate dimensions
-    width = max_x - min_x
-    height = max_y - min_y
-    depth = max_z - min_z
+    if mn[0] == float('inf'):
+        print("  ⚠️  Mesh objects have no vertices")
+        return None
+
+    return _report(name, mn, mx, mesh_count)
+
+def _report(name: str, mn, mx, mesh_count: int) -> dict:
+    """Print and return the dimensions of a model's bounding box"""
+    width, height, depth = dims = [float(hi - lo) for lo, hi in zip(mn, mx)]
+    max_dim = max(dims)
 
     print(f"  Mesh objects: {mesh_count}")
     print(f"  Bounding box: {width:.3f} × {height:.3f} × {depth:.3f} BU")
-    print(f"  Max dimension: {max(width, height, depth):.3f} BU")
+    print(f"  Max dimension: {max_dim:.3f} BU")
 
+    # Plain floats keep results JSON-serializable for the cache and worker output
     return {
-        "file": Path(filepath).name,
+        "file": name,
         "width": width,
         "height": height,
         "depth": depth,
-        "max": max(width, height, depth)
+        "max": max_dim
+    }
+
+JSON_MARKER = 'INSPECT_RESULTS_JSON:'
+
+def print_usage():
+    print("Usage: blender --background --python inspect_model_sizes.py -- <model_path1> <model_path2> ...")
+    print("       blender --background --python inspect_model_sizes.py -- --manifest <paths.txt>")
+    print("       python inspect_model_sizes.py [--jobs N] [--blender PATH] <model_path1> ...")
+    print("Options: --full-import  import glTF/GLB/OBJ files instead of reading their bounds directly")
+    print("         --fast         use object bound boxes instead of evaluated vertices (looser, ignores modifiers)")
+    print("         --no-cache     ignore and do not update the bounding box cache")
+    print("         --jobs N       parallel Blender workers when run outside Blender (default: CPU count)")
+    print("         --blender PATH Blender executable for the workers (default: $BLENDER or 'blender')")
+
+def parse_args(argv: list) -> Optional[Tuple[dict, list]]:
+    """Parse options and model paths (positional arguments plus --manifest files)"""
+    options = {
+        "full_import": False,
+        "fast": False,
+        "use_cache": True,
+        "json": False,
+        "jobs": 0,
+        "blender": os.environ.get('BLENDER', 'blender'),
     }
+    model_paths = []
+    args = iter(argv)
+    for arg in args:
+        if arg == '--full-import':
+            options["full_import"] = True
+        elif arg == '--fast':
+            options["fast"] = True
+        elif arg == '--no-cache':
+            options["use_cache"] = False
+        elif arg == '--json':
+            options["json"] = True
+        elif arg in ('--manifest', '--jobs', '--blender'):
+            value = next(args, None)
+            if value is None:
+                print(f"ERROR: {arg} requires a value")
+                return None
+            if arg == '--manifest':
+                try:
+                    with open(value, 'r') as f:
+                        model_paths.extend(line.strip() for line in f if line.strip())
+                except OSError as e:
+                    print(f"ERROR: Cannot read manifest {value}: {e}")
+                    return None
+            elif arg == '--jobs':
+                try:
+                    options["jobs"] = int(value)
+                except ValueError:
+                    print(f"ERROR: --jobs must be a number, got {value!r}")
+                    return None
+            else:
+                options["blender"] = value
+        else:
+            model_paths.append(arg)
+
+    if not model_paths:
+        print("ERROR: No model paths provided")
+        return None
+    return options, model_paths
+
+# Add-ons the inspector needs; every other enabled add-on is unloaded for the session
+REQUIRED_ADDONS = ('cycles', 'io_scene_fbx', 'io_scene_gltf2', 'io_scene_obj')
+
+def configure_session():
+    """Unload unneeded add-ons and use the cheapest render engine (background mode only)"""
+    import addon_utils
+    import bpy
+
+    if not bpy.app.background:
+        return
+
+    for name in list(bpy.context.preferences.addons.keys()):
+        if not name.startswith(REQUIRED_ADDONS):
+            addon_utils.disable(name, default_set=False)
+
+    bpy.context.scene.render.engine = 'BLENDER_WORKBENCH'
+    bpy.context.scene.render.use_persistent_data = False
+
+def inspect_models(model_paths: list, options: dict) -> list:
+    """Inspect models in this Blender session; returns one result (or None) per path"""
+    import bpy
+
+    cache = load_cache(BBOX_CACHE_PATH) if options["use_cache"] else None
+    configure_session()
+
+    if importlib.util.find_spec('numpy') is None:
+        # Without numpy only object bound boxes can be measured; treat as --fast so they aren't cached
+        print("WARNING: numpy not available, measuring object bound boxes (--fast) only")
+        options = {**options, "fast": True}
+
+    # Undo snapshots are useless here; restore the user's setting when done
+    edit_prefs = bpy.context.preferences.edit
+    use_global_undo = edit_prefs.use_global_undo
+    edit_prefs.use_global_undo = False
+
+    results = []
+    try:
+        for model_path in model_paths:
+            results.append(inspect_model(model_path, options["full_import"], cache, options["fast"]))
+
+            # Free remaining orphans (actions, armatures, node groups, ...) per model
+            bpy.data.orphans_purge(do_recursive=True)
+    finally:
+        edit_prefs.use_global_undo = use_global_undo
+        if cache is not None:
+            save_cache(BBOX_CACHE_PATH, cache)
+
+    return results
+
+def run_worker(model_paths: list, options: dict, manifest_path: str) -> list:
+    """Inspect a shard of models in a background Blender process"""
+    with open(manifest_path, 'w') as f:
+        f.write('\n'.join(model_paths) + '\n')
+
+    cmd = [options["blender"], '--background', '--python', os.path.abspath(__file__),
+           '--', '--json', '--no-cache', '--manifest', manifest_path]
+    if options["full_import"]:
+        cmd.append('--full-import')
+    if options["fast"]:
+        cmd.append('--fast')
+
+    try:
+        proc = subprocess.run(cmd, capture_output=True, text=True)
+    except OSError as e:
+        print(f"  ❌ Failed to start Blender: {e}")
+        return [None] * len(model_paths)
+
+    # Blender adds its own output, so the results are the last marked line
+    for line in reversed(proc.stdout.splitlines()):
+        if line.startswith(JSON_MARKER):
+            return json.loads(line[len(JSON_MARKER):])
+
+    print(f"  ❌ Worker failed (exit code {proc.returncode}): {proc.stderr.strip()[-500:]}")
+    return [None] * len(model_paths)
+
+def orchestrate(model_paths: list, options: dict) -> list:
+    """
+    Inspect models outside Blender by sharding cache misses across parallel
+    background Blender workers. Returns one result (or None) per path.
+    """
+    cache = load_cache(BBOX_CACHE_PATH) if options["use_cache"] else None
+
+    results = [None] * len(model_paths)
+    keys = {}
+    pending = []
+    for i, model_path in enumerate(model_paths):
+        if cache is not None:
+            try:
+                keys[i] = cache_key(model_path, options["full_import"])
+            except OSError as e:
+                print(f"  ❌ Failed to read {model_path}: {e}")
+                continue
+            entry = cache.get(keys[i])
+            if entry:
+                results[i] = {"file": Path(model_path).name, **entry}
+                continue
+        pending.append(i)
+
+    print(f"Cached: {sum(r is not None for r in results)}, to inspect: {len(pending)}")
+    if pending:
+        jobs = max(1, min(options["jobs"] or os.cpu_count() or 1, len(pending)))
+        shards = [pending[j::jobs] for j in range(jobs)]
+        print(f"Starting {jobs} Blender worker(s)...")
+
+        # Each worker is a separate Blender process, so threads only wait on them
+        with tempfile.TemporaryDirectory() as tmp_dir, ThreadPoolExecutor(max_workers=jobs) as pool:
+            futures = [
+                pool.submit(run_worker, [model_paths[i] for i in shard], options,
+                            os.path.join(tmp_dir, f"shard_{j}.txt"))
+                for j, shard in enumerate(shards)
+            ]
+            for shard, future in zip(shards, futures):
+                for i, result in zip(shard, future.result()):
+                    results[i] = result
+                    if result and cache is not None and not options["fast"]:
+                        cache[keys[i]] = {k: result[k] for k in ("width", "height", "depth", "max")}
+
+    if cache is not None:
+        save_cache(BBOX_CACHE_PATH, cache)
+    return results
+
+def print_summary(results: list):
+    """Print the size table and scale factor recommendations in a single write"""
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    maxes = [r['max'] for r in results]
+    avg_size = float(np.array(maxes).mean()) if np else sum(maxes) / len(maxes)
+
+    lines = ["", "=" * 60, "SUMMARY", "=" * 60, f"{'Model':<40} {'Max Size (BU)':<15}", "-" * 60]
+    lines.extend(f"{r['file']:<40} {r['max']:>14.3f}" for r in results)
+    lines += ["-" * 60, f"{'Average':<40} {avg_size:>14.3f}", ""]
+
+    # Recommendations
+    lines += ["SCALE FACTOR RECOMMENDATIONS:",
+              f"  For 1 BU = 1 game tile: scale_factor = {1.0 / avg_size:.3f}",
+              f"  For 2 BU = 1 game tile: scale_factor = {2.0 / avg_size:.3f}",
+              "  No scaling: scale_factor = 1.0", ""]
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 def main():
-    # Get arguments after '--'
-    argv = sys.argv
-    if '--' in argv:
-        argv = argv[argv.index('--') + 1:]
+    # Blender imports bpy before running the script; checking sys.modules avoids importing it here
+    in_blender = 'bpy' in sys.modules
+    if not in_blender:
+        # Plain Python: orchestrate Blender workers
+        argv = sys.argv[1:]
+    elif '--' in sys.argv:
+        # Get arguments after '--'
+        argv = sys.argv[sys.argv.index('--') + 1:]
     else:
-        print("Usage: blender --background --python inspect_model_sizes.py -- <model_path1> <model_path2> ...")
+        print_usage()
         return
 
     if not argv:
-        print("ERROR: No model paths provided")
+        print_usage()
+        return
+    parsed = parse_args(argv)
+    if parsed is None:
         return
+    options, model_paths = parsed
 
     print("=" * 60)
     print("Blender Model Size Inspector")
     print("=" * 60)
 
-    results = []
-    for model_path in argv:
-        result = inspect_model(model_path)
-        if result:
-            results.append(result)
+    if not in_blender:
+        results = orchestrate(model_paths, options)
+    else:
+        results = inspect_models(model_paths, options)
+
+    if options["json"]:
+        print(JSON_MARKER + json.dumps(results))
+        return
 
     # Summary
+    failed = [path for path, r in zip(model_paths, results) if not r]
+    results = [r for r in results if r]
     if results:
-        print("\n" + "=" * 60)
-        print("SUMMARY")
-        print("=" * 60)
-        print(f"{'Model':<40} {'Max Size (BU)':<15}")
-        print("-" * 60)
-        for r in results:
-            print(f"{r['file']:<40} {r['max']:>14.3f}")
-
-        avg_size = sum(r['max'] for r in results) / len(results)
-        print("-" * 60)
-        print(f"{'Average':<40} {avg_size:>14.3f}")
-        print()
+        print_summary(results)
 
-        # Recommendations
-        print("SCALE FACTOR RECOMMENDATIONS:")
-        print(f"  For 1 BU = 1 game tile: scale_factor = {1.0 / avg_size:.3f}")
-        print(f"  For 2 BU = 1 game tile: scale_factor = {2.0 / avg_size:.3f}")
-        print(f"  No scaling: scale_factor = 1.0")
+    # Workers' per-model messages are not shown, so always name what is missing from the summary
+    if failed:
+        print(f"Failed/skipped ({len(failed)}), not included in the summary:")
+        print('\n'.join(f"  {path}" for path in failed))
         print()
 
 if __name__ == "__main__":